@@ -1,5 +1,6 @@
 import { handler } from './index';
 import { Context } from 'aws-lambda';
+import { Logger } from '@aws-lambda-powertools/logger';
 
 // Mock AWS Lambda Powertools
 jest.mock('@aws-lambda-powertools/logger');
@@ -174,4 +175,21 @@ describe('Lambda Handler', () => {
       expect(body).toHaveProperty('correlationId');
     });
   });
+
+  describe('Logging', () => {
+    it('should log the event object without pre-serializing it', async () => {
+      const event = {
+        action: 'create' as const,
+        data: { name: 'test' },
+        source: 'test',
+      };
+
+      await handler(event, mockContext);
+
+      expect(Logger.prototype.info).toHaveBeenCalledWith(
+        'Lambda function started',
+        expect.objectContaining({ event })
+      );
+    });
+  });
 });
\ No newline at end of file
@@ -54,8 +54,9 @@ export const handler = async (event: LambdaEvent, context: Context): Promise<API
   const subsegment = segment?.addNewSubsegment('business-logic');
 
   try {
+    // Pass the event as-is; the logger serializes the whole entry once
     logger.info('Lambda function started', {
-      event: JSON.stringify(event),
+      event,
       context: {
         functionName: context.functionName,
         functionVersion: context.functionVersion,